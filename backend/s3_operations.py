@@ -8,7 +8,24 @@ import boto3
 from botocore.exceptions import ClientError, NoCredentialsError, EndpointConnectionError
 from botocore.client import Config
 from typing import List, Dict, Any, Optional
+from functools import lru_cache
 import os
+import threading
+
+
+# boto3 clients are thread-safe, so every worker using the same endpoint and
+# credentials shares one client (and its pooled connections) instead of
+# building a new session and client per operation
+_client_cache: Dict[tuple, Any] = {}
+_client_cache_lock = threading.Lock()
+
+# One boto3 session for all clients: its loader keeps parsed service models and
+# endpoint data, so a client for new credentials doesn't reload them. Sessions
+# are not thread-safe; clients are only created under _client_cache_lock.
+_shared_session: Optional[boto3.Session] = None
+
+# Error codes after which a cached client should not be reused
+_CREDENTIAL_ERROR_CODES = frozenset({'InvalidAccessKeyId', 'SignatureDoesNotMatch', 'AccessDenied'})
 
 
 class S3Client:
@@ -25,36 +42,70 @@ class S3Client:
     def _get_client(self):
         """Get or create S3 client"""
         if not self._client:
-            if self.verbose:
-                print(f"[VERBOSE] Creating boto3 session with access key: {self.access_key[:8]}...{self.access_key[-4:] if len(self.access_key) > 12 else '***'}")
+            with _client_cache_lock:
+                self._client = _client_cache.get(self._cache_key())
+                if self._client is None:
+                    self._client = self._create_client()
+                    _client_cache[self._cache_key()] = self._client
+                elif self.verbose:
+                    print(f"[VERBOSE] Reusing cached S3 client for endpoint: {self.endpoint_url}")
                 
-            session = boto3.Session(
-                aws_access_key_id=self.access_key,
-                aws_secret_access_key=self.secret_key
-            )
-            
+        return self._client
+    
+    def _cache_key(self) -> tuple:
+        return (self.endpoint_url, self.access_key, self.secret_key)
+    
+    def _create_client(self):
+        """Create a new boto3 S3 client (caller holds _client_cache_lock)"""
+        global _shared_session
+        if _shared_session is None:
             if self.verbose:
-                print(f"[VERBOSE] Creating S3 client with endpoint: {self.endpoint_url}")
-                print(f"[VERBOSE] Using signature version: s3v4, addressing style: path")
-            
-            self._client = session.client(
-                's3',
-                endpoint_url=self.endpoint_url,
-                config=Config(
-                    signature_version='s3v4',
-                    s3={
-                        'addressing_style': 'path'
-                    }
-                )
+                print(f"[VERBOSE] Creating shared boto3 session")
+            _shared_session = boto3.Session()
+        
+        if self.verbose:
+            print(f"[VERBOSE] Creating S3 client with endpoint: {self.endpoint_url}")
+            print(f"[VERBOSE] Using access key: {self.access_key[:8]}...{self.access_key[-4:] if len(self.access_key) > 12 else '***'}")
+            print(f"[VERBOSE] Using signature version: s3v4, addressing style: path")
+        
+        # Explicit keys on the client skip the session's credential provider chain
+        client = _shared_session.client(
+            's3',
+            endpoint_url=self.endpoint_url,
+            aws_access_key_id=self.access_key,
+            aws_secret_access_key=self.secret_key,
+            config=Config(
+                signature_version='s3v4',
+                s3={
+                    'addressing_style': 'path'
+                },
+                # Fail fast on dead endpoints instead of the 60 s defaults, and keep
+                # enough pooled keep-alive connections for s3transfer's worker threads
+                connect_timeout=5,
+                read_timeout=30,
+                tcp_keepalive=True,
+                max_pool_connections=50,
+                retries={'mode': 'standard', 'max_attempts': 3}
             )
+        )
+        
+        if self.verbose:
+            print(f"[VERBOSE] S3 client created successfully")
             
-            if self.verbose:
-                print(f"[VERBOSE] S3 client created successfully")
-                
-        return self._client
+        return client
     
-    def list_files_progressive(self, max_pages: int = 10, page_callback=None):
-        """List files progressively, calling callback for each page loaded"""
+    def discard_client(self):
+        """Drop this client from the shared cache so the next use builds a fresh one"""
+        with _client_cache_lock:
+            if _client_cache.get(self._cache_key()) is self._client:
+                del _client_cache[self._cache_key()]
+        self._client = None
+    
+    def list_files_progressive(self, max_pages: int = 10, page_callback=None, should_stop=None):
+        """List files progressively, calling callback for each page loaded
+        
+        should_stop is polled before each page request; returning True ends the listing.
+        """
         try:
             if self.verbose:
                 print(f"[VERBOSE] Getting S3 client...")
@@ -74,7 +125,16 @@ class S3Client:
             page_count = 0
             total_files = 0
             
-            for page in page_iterator:
+            # Advance the iterator by hand so should_stop is checked before each request
+            pages = iter(page_iterator)
+            while True:
+                if should_stop and should_stop():
+                    if self.verbose:
+                        print(f"[VERBOSE] Stop requested, ending listing after {page_count} pages")
+                    break
+                page = next(pages, None)
+                if page is None:
+                    break
                 page_count += 1
                 
                 if self.verbose:
@@ -130,6 +190,7 @@ class S3Client:
         except NoCredentialsError as e:
             if self.verbose:
                 print(f"[VERBOSE] NoCredentialsError: {str(e)}")
+            self.discard_client()
             raise Exception("Invalid credentials. Please check your access key and secret key.")
         except EndpointConnectionError as e:
             if self.verbose:
@@ -142,6 +203,9 @@ class S3Client:
             if self.verbose:
                 print(f"[VERBOSE] ClientError - Code: {error_code}, Message: {error_message}")
                 print(f"[VERBOSE] Full error response: {e.response}")
+            
+            if error_code in _CREDENTIAL_ERROR_CODES:
+                self.discard_client()
                 
             if error_code == 'NoSuchBucket':
                 raise Exception(f"Bucket '{self.bucket_name}' does not exist.")
@@ -192,8 +256,9 @@ class FileProcessor:
     """Handles file processing and virtual directory operations"""
     
     @staticmethod
+    @lru_cache(maxsize=4096)
     def format_size(size: int) -> str:
-        """Format file size in human readable format"""
+        """Format file size in human readable format (memoized, sizes repeat a lot)"""
         if size < 1024:
             return f"{size} B"
         elif size < 1024 * 1024:
@@ -204,54 +269,60 @@ class FileProcessor:
             return f"{size / (1024 * 1024 * 1024):.1f} GB"
     
     @staticmethod
-    def organize_files_by_folders(files: List[Dict[str, Any]]) -> tuple:
-        """Organize files into virtual folder structure"""
-        folders = {}
-        root_files = []
+    def _group_by_first_segment(entries) -> tuple:
+        """Group (file_info, path) pairs by first path segment in a single pass
+        
+        Returns parallel lists (names, files_per_name, total_sizes) sorted by name,
+        plus the (file_info, path) pairs that have no further path segment.
+        """
+        groups = {}
+        sizes = {}
+        loose = []
         
-        for file_info in files:
-            key = file_info['key']
-            if '/' in key:
-                # File is in a folder
-                folder = key.split('/')[0]
-                if folder not in folders:
-                    folders[folder] = []
-                folders[folder].append(file_info)
+        for file_info, path in entries:
+            slash = path.find('/')
+            if slash < 0:
+                loose.append((file_info, path))
+                continue
+            name = path[:slash]
+            group = groups.get(name)
+            if group is None:
+                groups[name] = [file_info]
+                sizes[name] = file_info['size']
             else:
-                # File is in root
-                root_files.append(file_info)
+                group.append(file_info)
+                sizes[name] += file_info['size']
         
-        return folders, root_files
+        names = sorted(groups)
+        return names, [groups[name] for name in names], [sizes[name] for name in names], loose
     
     @staticmethod
-    def get_folder_contents(files: List[Dict[str, Any]], folder_path: str) -> tuple:
-        """Get contents of a specific folder path"""
-        folder_prefix = f"{folder_path}/"
-        matching_files = []
-        
-        for file_info in files:
-            key = file_info['key']
-            if key.startswith(folder_prefix):
-                relative_path = key[len(folder_prefix):]
-                if relative_path:  # Make sure it's not empty
-                    matching_files.append((file_info, relative_path))
+    def organize_files_by_folders(files: List[Dict[str, Any]]) -> tuple:
+        """Organize files into virtual folder structure
         
-        # Group files by immediate subdirectories and direct files
-        subdirectories = {}
-        direct_files = []
+        Returns (folder_names, folder_files, folder_sizes, root_files) where the
+        first three are parallel lists sorted by folder name.
+        """
+        names, folder_files, folder_sizes, loose = FileProcessor._group_by_first_segment(
+            (file_info, file_info['key']) for file_info in files
+        )
+        return names, folder_files, folder_sizes, [file_info for file_info, _ in loose]
+    
+    @staticmethod
+    def get_folder_contents(files: List[Dict[str, Any]], folder_path: str) -> tuple:
+        """Get contents of a specific folder path
         
-        for file_info, relative_path in matching_files:
-            if '/' in relative_path:
-                # This file is in a subdirectory
-                subdirectory = relative_path.split('/')[0]
-                if subdirectory not in subdirectories:
-                    subdirectories[subdirectory] = []
-                subdirectories[subdirectory].append(file_info)
-            else:
-                # This file is directly in the current folder
-                direct_files.append((file_info, relative_path))
+        Returns (subdirectory_names, subdirectory_files, subdirectory_sizes, direct_files)
+        where the first three are parallel lists sorted by name and direct_files holds
+        (file_info, relative_path) pairs.
+        """
+        folder_prefix = f"{folder_path}/"
+        prefix_len = len(folder_prefix)
         
-        return subdirectories, direct_files
+        return FileProcessor._group_by_first_segment(
+            (file_info, file_info['key'][prefix_len:]) for file_info in files
+            if file_info['key'].startswith(folder_prefix) and len(file_info['key']) > prefix_len
+        )
 
 
 class DownloadManager:
@@ -4,6 +4,7 @@ Worker threads for S3 operations
 Handles background operations without blocking the UI
 """
 
+import threading
 from PyQt6.QtCore import QThread, pyqtSignal
 from typing import List, Dict, Any
 from .s3_operations import S3Client, DownloadManager, UploadManager, DeleteManager
@@ -28,17 +29,17 @@ class S3Worker(QThread):
         self.verbose = verbose
         self.max_retries = max_retries
         self.max_pages = max_pages
-        self._stop_requested = False
+        self._stop_event = threading.Event()
         
     def stop_operation(self):
         """Request the worker to stop its operation"""
-        self._stop_requested = True
+        self._stop_event.set()
         
     def run(self):
         attempt = 0
         last_error = None
         
-        while attempt < self.max_retries and not self._stop_requested:
+        while attempt < self.max_retries and not self._stop_event.is_set():
             attempt += 1
             
             try:
@@ -68,7 +69,7 @@ class S3Worker(QThread):
                 all_files = []
                 
                 def on_page_loaded(page_info):
-                    if self._stop_requested:
+                    if self._stop_event.is_set():
                         return
                         
                     all_files.extend(page_info['files'])
@@ -81,9 +82,13 @@ class S3Worker(QThread):
                     if self.verbose:
                         print(f"[VERBOSE] Page {page_info['page_number']} loaded: {page_info['files_in_page']} files")
                 
-                result = s3_client.list_files_progressive(max_pages=self.max_pages, page_callback=on_page_loaded)
+                result = s3_client.list_files_progressive(
+                    max_pages=self.max_pages,
+                    page_callback=on_page_loaded,
+                    should_stop=self._stop_event.is_set
+                )
                 
-                if self._stop_requested:
+                if self._stop_event.is_set():
                     return
                 
                 if self.verbose:
@@ -108,11 +113,9 @@ class S3Worker(QThread):
                     if self.verbose:
                         print(f"[VERBOSE] Will retry in 2 seconds... ({attempt}/{self.max_retries})")
                     
-                    # Wait 2 seconds before retry (check for stop request every 100ms)
-                    for i in range(20):
-                        if self._stop_requested:
-                            return
-                        self.msleep(100)
+                    # Wait 2 seconds before retry, waking immediately on a stop request
+                    if self._stop_event.wait(2):
+                        return
                 else:
                     # Last attempt failed - emit max retries exceeded
                     if self.verbose:
@@ -10,10 +10,9 @@ import argparse
 from typing import List, Dict, Any, Optional
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QProgressBar, QSplitter, QStatusBar, QMessageBox, QFileDialog,
-    QListWidgetItem
+    QProgressBar, QSplitter, QStatusBar, QMessageBox, QFileDialog
 )
-from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtCore import Qt, QTimer, QModelIndex
 from PyQt6.QtGui import QIcon, QPixmap
 from PyQt6.QtSvg import QSvgRenderer
 
@@ -471,7 +470,7 @@ class S3BrowserMainWindow(QMainWindow):
         # Re-trigger the last successful connection
         self.connection_widget.request_connection()
     
-    def on_item_double_clicked(self, item: QListWidgetItem):
+    def on_item_double_clicked(self, item: QModelIndex):
         """Handle double-click on list items"""
         item_data = item.data(Qt.ItemDataRole.UserRole)
         
@@ -492,7 +491,7 @@ class S3BrowserMainWindow(QMainWindow):
         
         self.details_widget.update_selection(current_item, selected_items)
     
-    def start_download(self, selected_items: List[QListWidgetItem]):
+    def start_download(self, selected_items: List[QModelIndex]):
         """Start downloading selected files"""
         if not selected_items:
             return
@@ -685,7 +684,7 @@ class S3BrowserMainWindow(QMainWindow):
         self.progress_bar.setVisible(False)
         self.status_bar.showMessage("Upload completed")
     
-    def start_delete(self, selected_items: List[QListWidgetItem]):
+    def start_delete(self, selected_items: List[QModelIndex]):
         """Start deleting selected files"""
         if not selected_items:
             return
@@ -793,7 +792,7 @@ class S3BrowserMainWindow(QMainWindow):
         self.progress_bar.setVisible(False)
         self.status_bar.showMessage("Delete operation completed")
     
-    def copy_file_url(self, item: QListWidgetItem):
+    def copy_file_url(self, item: QModelIndex):
         """Copy the file URL to clipboard"""
         file_info = item.data(Qt.ItemDataRole.UserRole)
         connection_data = self.connection_widget.get_current_profile_data()
@@ -817,6 +816,11 @@ class S3BrowserMainWindow(QMainWindow):
     def _get_connection_data(self) -> Dict[str, str]:
         """Get current connection data for URL generation"""
         return self.connection_widget.get_current_profile_data()
+    
+    def closeEvent(self, event):
+        """Stop background threads owned by child widgets before closing"""
+        self.details_widget.shutdown()
+        super().closeEvent(event)
 
 
 def load_app_icon() -> QIcon:
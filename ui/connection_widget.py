@@ -6,14 +6,53 @@ Handles S3 connection settings and profile management
 
 import json
 import os
-from typing import Dict, Any
+import tempfile
+from typing import Dict, Any, List, Optional
 
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, 
     QPushButton, QGroupBox, QCheckBox, QComboBox,
-    QMessageBox, QInputDialog
+    QMessageBox, QInputDialog, QFileDialog
 )
-from PyQt6.QtCore import pyqtSignal
+from PyQt6.QtCore import pyqtSignal, QObject, QRunnable, QThreadPool
+
+
+# Resolved once at import; expanduser can hit the password database
+PROFILES_FILE = os.path.join(os.path.expanduser("~"), ".s3_browser_profiles.json")
+
+# Fields every saved or imported connection profile must have
+_PROFILE_FIELDS = frozenset({"endpoint_url", "bucket_name", "access_key", "secret_key"})
+
+
+class _CredentialsFileSignals(QObject):
+    """Signals emitted by _CredentialsFileRunnable"""
+    
+    finished = pyqtSignal(str, object, str)  # operation, imported data, error message
+
+
+class _CredentialsFileRunnable(QRunnable):
+    """Reads or writes a credentials JSON file on the global thread pool"""
+    
+    def __init__(self, operation: str, file_name: str, credentials: Dict[str, str] = None):
+        super().__init__()
+        self.operation = operation  # "import" or "export"
+        self.file_name = file_name
+        self.credentials = credentials
+        self.signals = _CredentialsFileSignals()
+    
+    def run(self):
+        try:
+            if self.operation == "import":
+                with open(self.file_name, 'r') as f:
+                    result = json.load(f)
+            else:
+                with open(self.file_name, 'w') as f:
+                    json.dump(self.credentials, f, indent=2)
+                result = None
+        except Exception as e:
+            self.signals.finished.emit(self.operation, None, str(e))
+            return
+        self.signals.finished.emit(self.operation, result, "")
 
 
 class ConnectionWidget(QWidget):
@@ -25,7 +64,11 @@ class ConnectionWidget(QWidget):
     
     def __init__(self):
         super().__init__()
-        self.profiles_file = os.path.join(os.path.expanduser("~"), ".s3_browser_profiles.json")
+        self.profiles_file = PROFILES_FILE
+        self._profiles_cache: Dict[str, Any] = {}
+        self._profiles_cache_sig = None  # (st_mtime_ns, st_size) of the file behind _profiles_cache
+        self._sorted_profile_names: Optional[List[str]] = None  # sorted(_profiles_cache), built on demand
+        self._credentials_runnable = None  # Import/export currently running in the background
         self.init_ui()
         self.load_profiles()
     
@@ -181,58 +224,163 @@ class ConnectionWidget(QWidget):
         self.cancel_button.setVisible(show_cancel)
     
     # Profile Management Methods
+    def _read_profiles(self) -> Dict[str, Any]:
+        """Read saved profiles, reusing the last parse while the file is unchanged
+        
+        The returned dict is shared with the cache; copy it before modifying.
+        """
+        try:
+            st = os.stat(self.profiles_file)
+        except FileNotFoundError:
+            self._profiles_cache, self._profiles_cache_sig = {}, None
+            self._sorted_profile_names = None
+            return self._profiles_cache
+        
+        sig = (st.st_mtime_ns, st.st_size)
+        if sig != self._profiles_cache_sig:
+            with open(self.profiles_file, 'r') as f:
+                self._profiles_cache = json.load(f)
+            self._sorted_profile_names = None
+            self._profiles_cache_sig = sig
+        return self._profiles_cache
+    
     def load_profiles(self):
         """Load saved credential profiles from file"""
         try:
             if os.path.exists(self.profiles_file):
-                with open(self.profiles_file, 'r') as f:
-                    profiles = json.load(f)
+                profiles = self._read_profiles()
                 
-                # Clear existing profiles (except the default)
-                self.profile_combo.clear()
-                self.profile_combo.addItem("-- Select or create new --")
-                
-                # Add saved profiles
-                for profile_name in sorted(profiles.keys()):
-                    self.profile_combo.addItem(profile_name)
+                # Names are only re-sorted after the profiles themselves change
+                if self._sorted_profile_names is None:
+                    self._sorted_profile_names = sorted(profiles.keys())
+                self._sync_profile_combo(self._sorted_profile_names)
                     
         except Exception as e:
             print(f"Error loading profiles: {e}")
     
+    def _sync_profile_combo(self, profile_names: List[str]):
+        """Patch the dropdown to match the sorted profile names, touching only changed entries"""
+        combo = self.profile_combo
+        if combo.itemText(0) != "-- Select or create new --":
+            combo.setItemText(0, "-- Select or create new --")
+        
+        existing = [combo.itemText(i) for i in range(1, combo.count())]
+        if existing == profile_names:
+            return
+        
+        if not existing:
+            # First fill: add everything in one batch call
+            combo.addItems(profile_names)
+            return
+        
+        # Patch silently so removing the selected entry doesn't load its neighbour;
+        # a vanished selection falls back to the placeholder instead
+        previous_text = combo.currentText()
+        wanted = set(profile_names)
+        combo.blockSignals(True)
+        try:
+            if combo.currentIndex() > 0 and previous_text not in wanted:
+                combo.setCurrentIndex(0)
+            
+            # Remove profiles that are gone (back to front so indexes stay valid)
+            for i in range(combo.count() - 1, 0, -1):
+                if combo.itemText(i) not in wanted:
+                    combo.removeItem(i)
+            
+            # Insert new profiles at their sorted position; both lists are sorted
+            present = set(existing) & wanted
+            for position, profile_name in enumerate(profile_names, 1):
+                if profile_name not in present:
+                    combo.insertItem(position, profile_name)
+        finally:
+            combo.blockSignals(False)
+        
+        if combo.currentText() != previous_text:
+            combo.currentTextChanged.emit(combo.currentText())
+    
     def save_profiles(self, profiles: Dict[str, Any]):
         """Save credential profiles to file"""
+        if profiles == self._profiles_cache and self._profiles_cache_sig is not None:
+            return  # Nothing changed since the file was last read or written
+        
+        tmp_path = None
         try:
-            with open(self.profiles_file, 'w') as f:
-                json.dump(profiles, f, indent=2)
+            # Write a sibling temp file and swap it in, so a crash mid-write
+            # can never leave a truncated profiles file behind
+            fd, tmp_path = tempfile.mkstemp(
+                prefix=".s3_browser_profiles.", suffix=".tmp",
+                dir=os.path.dirname(self.profiles_file)
+            )
+            with os.fdopen(fd, 'w') as f:
+                # Compact on disk; only exported credentials are pretty-printed
+                json.dump(profiles, f, separators=(',', ':'))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.profiles_file)
+            tmp_path = None
+            
+            st = os.stat(self.profiles_file)
+            self._profiles_cache = profiles
+            self._sorted_profile_names = None
+            self._profiles_cache_sig = (st.st_mtime_ns, st.st_size)
         except Exception as e:
             QMessageBox.warning(self, "Error", f"Could not save profiles: {e}")
+        finally:
+            if tmp_path is not None:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
     
     def export_credentials(self):
-            """Export credentials to JSON file"""
-            credentials = self.get_current_profile_data()
-            options = QFileDialog.Options()
-            file_name, _ = QFileDialog.getSaveFileName(self, "Export Credentials", "", "JSON Files (*.json)", options=options)
-            if file_name:
-                try:
-                    with open(file_name, 'w') as f:
-                        json.dump(credentials, f, indent=2)
-                    QMessageBox.information(self, "Success", "Credentials exported successfully.")
-                except Exception as e:
-                    QMessageBox.warning(self, "Error", f"Failed to export credentials: {e}")
-
+        """Export credentials to JSON file"""
+        credentials = self.get_current_profile_data()
+        file_name, _ = QFileDialog.getSaveFileName(self, "Export Credentials", "", "JSON Files (*.json)")
+        if file_name:
+            self._start_credentials_file_io("export", file_name, credentials)
+    
     def import_credentials(self):
-            """Import credentials from JSON file"""
-            options = QFileDialog.Options()
-            file_name, _ = QFileDialog.getOpenFileName(self, "Import Credentials", "", "JSON Files (*.json)", options=options)
-            if file_name:
-                try:
-                    with open(file_name, 'r') as f:
-                        credentials = json.load(f)
-                    self.load_profile_data(credentials)
-                    QMessageBox.information(self, "Success", "Credentials imported successfully.")
-                except Exception as e:
-                    QMessageBox.warning(self, "Error", f"Failed to import credentials: {e}")
-
+        """Import credentials from JSON file"""
+        file_name, _ = QFileDialog.getOpenFileName(self, "Import Credentials", "", "JSON Files (*.json)")
+        if file_name:
+            self._start_credentials_file_io("import", file_name)
+    
+    def _start_credentials_file_io(self, operation: str, file_name: str, credentials: Dict[str, str] = None):
+        """Run credentials file I/O on the thread pool so slow disks don't block the UI"""
+        self.export_button.setEnabled(False)
+        self.import_button.setEnabled(False)
+        
+        self._credentials_runnable = _CredentialsFileRunnable(operation, file_name, credentials)
+        self._credentials_runnable.signals.finished.connect(self.on_credentials_file_done)
+        QThreadPool.globalInstance().start(self._credentials_runnable)
+    
+    def on_credentials_file_done(self, operation: str, credentials: Any, error: str):
+        """Handle background import/export result"""
+        self._credentials_runnable = None
+        self.export_button.setEnabled(True)
+        self.import_button.setEnabled(True)
+        
+        if operation == "import":
+            if not error and not isinstance(credentials, dict):
+                error = "not a credentials object"
+            if not error:
+                missing = sorted(_PROFILE_FIELDS - credentials.keys())
+                invalid = sorted(field for field in _PROFILE_FIELDS & credentials.keys()
+                                 if not isinstance(credentials[field], str))
+                if missing:
+                    error = f"missing fields: {', '.join(missing)}"
+                elif invalid:
+                    error = f"fields must be text: {', '.join(invalid)}"
+            if error:
+                QMessageBox.warning(self, "Error", f"Failed to import credentials: {error}")
+                return
+            self.load_profile_data(credentials)
+            QMessageBox.information(self, "Success", "Credentials imported successfully.")
+        else:
+            if error:
+                QMessageBox.warning(self, "Error", f"Failed to export credentials: {error}")
+                return
+            QMessageBox.information(self, "Success", "Credentials exported successfully.")
     
     def get_current_profile_data(self) -> Dict[str, str]:
         """Get current form data as profile"""
@@ -258,8 +406,7 @@ class ConnectionWidget(QWidget):
             
         try:
             if os.path.exists(self.profiles_file):
-                with open(self.profiles_file, 'r') as f:
-                    profiles = json.load(f)
+                profiles = self._read_profiles()
                 
                 if profile_name in profiles:
                     self.load_profile_data(profiles[profile_name])
@@ -294,9 +441,7 @@ class ConnectionWidget(QWidget):
         # Load existing profiles
         profiles = {}
         try:
-            if os.path.exists(self.profiles_file):
-                with open(self.profiles_file, 'r') as f:
-                    profiles = json.load(f)
+            profiles = dict(self._read_profiles())
         except Exception as e:
             print(f"Error loading existing profiles: {e}")
         
@@ -340,10 +485,7 @@ class ConnectionWidget(QWidget):
         
         try:
             # Load existing profiles
-            profiles = {}
-            if os.path.exists(self.profiles_file):
-                with open(self.profiles_file, 'r') as f:
-                    profiles = json.load(f)
+            profiles = dict(self._read_profiles())
             
             # Remove the profile
             if current_profile in profiles:
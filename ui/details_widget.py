@@ -5,61 +5,102 @@ Displays file/folder details and action buttons
 """
 
 from typing import List, Dict, Any, Optional
-import os
 import requests
+from requests.adapters import HTTPAdapter
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
-    QTextEdit, QListWidgetItem, QApplication, QScrollArea
+    QTextEdit, QApplication, QScrollArea
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QThread, QTimer
-from PyQt6.QtGui import QPixmap, QMovie
+from PyQt6.QtCore import Qt, pyqtSignal, pyqtSlot, QObject, QThread, QTimer, QModelIndex
+from PyQt6.QtGui import QPixmap, QPixmapCache, QImage, QMovie
 
 from backend import FileProcessor
 
 
-class ImagePreviewWorker(QThread):
-    """Worker thread for downloading and loading image previews"""
+# Shared HTTP session so successive previews reuse pooled keep-alive connections
+_session = requests.Session()
+_session.mount('https://', HTTPAdapter(pool_connections=10, pool_maxsize=10, max_retries=3))
+_session.mount('http://', HTTPAdapter(pool_connections=10, pool_maxsize=10, max_retries=3))
+
+
+class ImagePreviewWorker(QObject):
+    """Long-lived worker for downloading and loading image previews
+    
+    Lives on its own QThread and receives requests through queued signals.
+    Only the most recent request is served; older ones are dropped.
+    """
     
-    image_loaded = pyqtSignal(QPixmap)
-    error_occurred = pyqtSignal(str)
+    image_loaded = pyqtSignal(str, QImage)  # cache_key, image
+    error_occurred = pyqtSignal(str, str)  # cache_key, error_message
     
-    def __init__(self, url: str, max_size: int = 2 * 1024 * 1024):  # 2MB limit
+    def __init__(self, max_size: int = 2 * 1024 * 1024):  # 2MB limit
         super().__init__()
-        self.url = url
         self.max_size = max_size
+        self.latest_key: Optional[str] = None  # Set from the GUI thread before each request
     
-    def run(self):
+    def cancel(self):
+        """Abandon the in-flight request; safe to call from the GUI thread"""
+        self.latest_key = None
+    
+    @pyqtSlot(str, str)
+    def request(self, url: str, cache_key: str):
+        """Download and decode the image at url unless a newer request superseded it"""
+        if cache_key != self.latest_key:
+            return
+        
         try:
-            # Download image data with size limit
-            response = requests.get(self.url, stream=True, timeout=10)
+            # Download image data with size limit, asking the server not to send
+            # more than one byte past what we are willing to accept
+            response = _session.get(
+                url,
+                stream=True,
+                timeout=10,
+                headers={'Range': f'bytes=0-{self.max_size}'}
+            )
             response.raise_for_status()
             
-            # Check content length
-            content_length = response.headers.get('content-length')
-            if content_length and int(content_length) > self.max_size:
-                self.error_occurred.emit("Image too large for preview")
-                return
+            if response.status_code == 206:
+                # Partial content - the full object size follows the slash in Content-Range
+                content_range = response.headers.get('content-range', '')
+                total_size = content_range.rpartition('/')[2]
+                if total_size.isdigit() and int(total_size) > self.max_size:
+                    self.error_occurred.emit(cache_key, "Image too large for preview")
+                    return
+            else:
+                # Server ignored the range - check content length
+                content_length = response.headers.get('content-length')
+                if content_length and int(content_length) > self.max_size:
+                    self.error_occurred.emit(cache_key, "Image too large for preview")
+                    return
             
             # Download data
             data = b''
             for chunk in response.iter_content(chunk_size=8192):
+                if cache_key != self.latest_key:
+                    return  # A newer selection replaced this one
                 data += chunk
                 if len(data) > self.max_size:
-                    self.error_occurred.emit("Image too large for preview")
+                    self.error_occurred.emit(cache_key, "Image too large for preview")
                     return
             
-            # Create pixmap from data
-            pixmap = QPixmap()
-            if pixmap.loadFromData(data):
-                # Scale down if too large
-                if pixmap.width() > 300 or pixmap.height() > 300:
-                    pixmap = pixmap.scaled(300, 300, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
-                self.image_loaded.emit(pixmap)
+            if cache_key != self.latest_key:
+                return  # Cancelled while the last chunk was arriving
+            
+            # Decode into a QImage here; QPixmap may only be used on the GUI thread
+            image = QImage()
+            if image.loadFromData(data):
+                # Scale down if too large - a cheap pass first so the smooth
+                # filter only has to work on a small image
+                if image.width() > 1200 or image.height() > 1200:
+                    image = image.scaled(600, 600, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.FastTransformation)
+                if image.width() > 300 or image.height() > 300:
+                    image = image.scaled(300, 300, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
+                self.image_loaded.emit(cache_key, image)
             else:
-                self.error_occurred.emit("Failed to load image data")
+                self.error_occurred.emit(cache_key, "Failed to load image data")
                 
         except Exception as e:
-            self.error_occurred.emit(f"Error loading image: {str(e)}")
+            self.error_occurred.emit(cache_key, f"Error loading image: {str(e)}")
 
 
 class DetailsWidget(QWidget):
@@ -68,14 +109,43 @@ class DetailsWidget(QWidget):
     # Signals
     download_requested = pyqtSignal(list)  # selected_items
     delete_requested = pyqtSignal(list)    # selected_items
-    copy_url_requested = pyqtSignal(QListWidgetItem)  # current_item
+    copy_url_requested = pyqtSignal(QModelIndex)  # current_item
+    preview_requested = pyqtSignal(str, str)  # url, cache_key (handled on the preview thread)
+    
+    # File extensions that get an image preview
+    _IMAGE_EXTS = ('.jpg', '.jpeg', '.png', '.gif', '.bmp', '.webp', '.svg', '.tiff', '.ico')
     
     def __init__(self):
         super().__init__()
-        self.current_item: Optional[QListWidgetItem] = None
-        self.selected_items: List[QListWidgetItem] = []
-        self.image_worker: Optional[ImagePreviewWorker] = None
+        self.current_item: Optional[QModelIndex] = None
+        self.selected_items: List[QModelIndex] = []
+        self._last_selection_sig: Optional[tuple] = None
+        self._button_state: Optional[tuple] = (False, False, False, None, None)  # Last state applied to the action buttons
+        self._pending_cache_key: Optional[str] = None
         self.connection_data_callback = None  # Will be set by main window
+        
+        # Keep recently previewed images in memory (limit is in KB)
+        QPixmapCache.setCacheLimit(64 * 1024)
+        
+        # Debounce image previews so scrubbing through the list only loads the final selection
+        self._pending_preview_info: Optional[Dict[str, Any]] = None
+        self._preview_debounce = QTimer(self)
+        self._preview_debounce.setSingleShot(True)
+        self._preview_debounce.setInterval(150)
+        self._preview_debounce.timeout.connect(self._do_preview)
+        
+        # A single preview thread is reused for every selection
+        self._preview_thread = QThread(self)
+        self._preview_worker = ImagePreviewWorker()
+        self._preview_worker.moveToThread(self._preview_thread)
+        self.preview_requested.connect(self._preview_worker.request)
+        self._preview_worker.image_loaded.connect(self._on_image_loaded)
+        self._preview_worker.error_occurred.connect(self._on_image_error)
+        self._preview_thread.start()
+        app = QApplication.instance()
+        if app:
+            app.aboutToQuit.connect(self.shutdown)
+        
         self.init_ui()
     
     def init_ui(self):
@@ -137,8 +207,18 @@ class DetailsWidget(QWidget):
         button_layout.addStretch()
         return button_layout
     
-    def update_selection(self, current_item: Optional[QListWidgetItem], selected_items: List[QListWidgetItem]):
+    def update_selection(self, current_item: Optional[QModelIndex], selected_items: List[QModelIndex]):
         """Update the widget with new selection"""
+        # Indexes are rebuilt on every call, but the row data dicts they point at are
+        # stable, so an identical signature means nothing changed (e.g. focus moving)
+        selection_sig = (
+            id(current_item.data(Qt.ItemDataRole.UserRole)) if current_item is not None else None,
+            tuple(id(item.data(Qt.ItemDataRole.UserRole)) for item in selected_items)
+        )
+        if selection_sig == self._last_selection_sig:
+            return
+        self._last_selection_sig = selection_sig
+        
         self.current_item = current_item
         self.selected_items = selected_items
         
@@ -149,6 +229,7 @@ class DetailsWidget(QWidget):
         """Update the details text display"""
         if not self.selected_items:
             self.details_text.clear()
+            self._hide_image_preview()
             return
         
         if len(self.selected_items) == 1:
@@ -156,25 +237,25 @@ class DetailsWidget(QWidget):
         else:
             self._display_multiple_items_summary()
     
-    def _display_single_item_details(self, item: QListWidgetItem):
+    def _display_single_item_details(self, item: QModelIndex):
         """Display details for a single selected item"""
         item_data = item.data(Qt.ItemDataRole.UserRole)
         
         if item_data.get('is_folder', False):
             # Display folder details
             folder_info = item_data
+            
+            # Show first few files in the folder
+            preview = "\n".join(f"• {file_info['key']}" for file_info in folder_info['files'][:5])
+            if len(folder_info['files']) > 5:
+                preview += f"\n... and {len(folder_info['files']) - 5} more files"
+            
             details = f"""Folder: {folder_info['folder_name']}/
 Files: {folder_info['file_count']}
 Total Size: {FileProcessor.format_size(folder_info['total_size'])}
 
 Contents:
-"""
-            
-            # Show first few files in the folder
-            for i, file_info in enumerate(folder_info['files'][:5]):
-                details += f"• {file_info['key']}\n"
-            if len(folder_info['files']) > 5:
-                details += f"... and {len(folder_info['files']) - 5} more files"
+{preview}"""
             
         else:
             # Display file details
@@ -189,31 +270,31 @@ Storage Class: {file_info['storage_class']}"""
         
         # Check if it's an image file and show preview (only for single files)
         if not item_data.get('is_folder', False):
-            self._update_image_preview(item_data)
+            self._pending_preview_info = item_data
+            self._preview_debounce.start()
         else:
             self._hide_image_preview()
     
     def _display_multiple_items_summary(self):
         """Display summary for multiple selected items"""
-        total_size = 0
-        file_count = 0
-        folder_count = 0
-        
-        for item in self.selected_items:
-            item_data = item.data(Qt.ItemDataRole.UserRole)
-            if item_data.get('is_folder', False):
-                # It's a folder
-                total_size += item_data['total_size']
-                file_count += item_data['file_count']
-                folder_count += 1
-            else:
-                # It's a file
-                total_size += item_data['size']
-                file_count += 1
+        # Pull item data out of Qt once, then aggregate with builtin reductions
+        data = [item.data(Qt.ItemDataRole.UserRole) for item in self.selected_items]
+        is_folder = [d.get('is_folder', False) for d in data]
+        total_size = sum(d['total_size'] if f else d['size'] for d, f in zip(data, is_folder))
+        file_count = sum(d['file_count'] if f else 1 for d, f in zip(data, is_folder))
+        folder_count = sum(is_folder)
         
         # Format total size
         size_str = FileProcessor.format_size(total_size)
         
+        # Show first 10 items
+        preview = "\n".join(
+            f"📁 {item_data['folder_name']}/" if folder else f"📄 {item_data['key']}"
+            for item_data, folder in zip(data[:10], is_folder)
+        )
+        if len(self.selected_items) > 10:
+            preview += f"\n... and {len(self.selected_items) - 10} more items"
+        
         # Create details text
         if folder_count > 0:
             details = f"""Selected Items: {len(self.selected_items)} ({folder_count} folders, {len(self.selected_items) - folder_count} files)
@@ -221,23 +302,13 @@ Total Files: {file_count}
 Total Size: {size_str}
 
 Items:
-"""
+{preview}"""
         else:
             details = f"""Selected Files: {len(self.selected_items)}
 Total Size: {size_str}
 
 Files:
-"""
-        
-        # Show first 10 items
-        for item in self.selected_items[:10]:
-            item_data = item.data(Qt.ItemDataRole.UserRole)
-            if item_data.get('is_folder', False):
-                details += f"📁 {item_data['folder_name']}/\n"
-            else:
-                details += f"📄 {item_data['key']}\n"
-        if len(self.selected_items) > 10:
-            details += f"... and {len(self.selected_items) - 10} more items"
+{preview}"""
             
         self.details_text.setText(details)
         
@@ -247,9 +318,7 @@ Files:
     def _update_button_states(self):
         """Update the state and text of action buttons"""
         if not self.selected_items:
-            self.download_button.setEnabled(False)
-            self.copy_url_button.setEnabled(False)
-            self.delete_button.setEnabled(False)
+            self._apply_button_state((False, False, False, None, None))
             return
         
         if len(self.selected_items) == 1:
@@ -257,26 +326,34 @@ Files:
             item_data = self.selected_items[0].data(Qt.ItemDataRole.UserRole)
             is_folder = item_data.get('is_folder', False)
             
-            self.download_button.setEnabled(True)
-            self.copy_url_button.setEnabled(not is_folder)  # Only files have URLs
-            self.delete_button.setEnabled(True)
-            
-            # Update button text
-            self.download_button.setText("Download")
-            self.delete_button.setText("Delete")
+            # Only files have URLs
+            self._apply_button_state((True, not is_folder, True, "Download", "Delete"))
             
         else:
             # Multiple selection
             has_folders = any(item.data(Qt.ItemDataRole.UserRole).get('is_folder', False) 
                             for item in self.selected_items)
             
-            self.download_button.setEnabled(True)
-            self.copy_url_button.setEnabled(not has_folders)  # Mixed selection can't copy URLs
-            self.delete_button.setEnabled(True)
-            
-            # Update button text for multiple items
-            self.download_button.setText(f"Download {len(self.selected_items)} Items")
-            self.delete_button.setText(f"Delete {len(self.selected_items)} Items")
+            # Mixed selection can't copy URLs; button text shows the item count
+            count = len(self.selected_items)
+            self._apply_button_state(
+                (True, not has_folders, True, f"Download {count} Items", f"Delete {count} Items")
+            )
+    
+    def _apply_button_state(self, state: tuple):
+        """Apply (download_enabled, copy_enabled, delete_enabled, download_text, delete_text),
+        skipping the Qt calls when it matches what the buttons already show"""
+        if state == self._button_state:
+            return
+        self._button_state = state
+        
+        download_enabled, copy_enabled, delete_enabled, download_text, delete_text = state
+        self.download_button.setEnabled(download_enabled)
+        self.copy_url_button.setEnabled(copy_enabled)
+        self.delete_button.setEnabled(delete_enabled)
+        if download_text is not None:
+            self.download_button.setText(download_text)
+            self.delete_button.setText(delete_text)
     
     def _handle_download(self):
         """Handle download button click"""
@@ -290,18 +367,21 @@ Files:
     
     def _handle_copy_url(self):
         """Handle copy URL button click"""
-        if self.current_item:
+        if self.current_item is not None:
             self.copy_url_requested.emit(self.current_item)
     
     def clear(self):
         """Clear the details display"""
         self.details_text.clear()
+        self._hide_image_preview()
         self.current_item = None
         self.selected_items = []
+        self._last_selection_sig = None
         self._update_button_states()
     
     def set_buttons_enabled(self, enabled: bool):
         """Enable or disable all action buttons"""
+        self._button_state = None  # Buttons no longer match the cached state
         self.download_button.setEnabled(enabled and bool(self.selected_items))
         self.copy_url_button.setEnabled(enabled and bool(self.selected_items))
         self.delete_button.setEnabled(enabled and bool(self.selected_items))
@@ -312,17 +392,17 @@ Files:
     
     def _is_image_file(self, filename: str) -> bool:
         """Check if file is an image based on extension"""
-        image_extensions = {'.jpg', '.jpeg', '.png', '.gif', '.bmp', '.webp', '.svg', '.tiff', '.ico'}
-        _, ext = os.path.splitext(filename.lower())
-        return ext in image_extensions
+        return filename.lower().endswith(self._IMAGE_EXTS)
+    
+    def _do_preview(self):
+        """Load the preview for the most recent single selection"""
+        file_info = self._pending_preview_info
+        self._pending_preview_info = None
+        if file_info is not None:
+            self._update_image_preview(file_info)
     
     def _update_image_preview(self, file_info: Dict[str, Any]):
         """Update image preview for a file"""
-        # Cancel any existing image loading
-        if self.image_worker and self.image_worker.isRunning():
-            self.image_worker.quit()
-            self.image_worker.wait()
-        
         # Check if file is an image
         if not self._is_image_file(file_info['key']):
             self._hide_image_preview()
@@ -352,32 +432,64 @@ Files:
         # Show preview section
         self.image_preview_label.setVisible(True)
         self.image_scroll_area.setVisible(True)
+        
+        # Reuse a previously loaded preview of the same object version
+        cache_key = f"{bucket_name}:{file_key}:{file_info.get('etag', '')}"
+        cached_pixmap = QPixmapCache.find(cache_key)
+        if cached_pixmap is not None and not cached_pixmap.isNull():
+            self._pending_cache_key = None
+            self._preview_worker.cancel()
+            self.image_display.setPixmap(cached_pixmap)
+            self.image_display.setText("")
+            return
+        
         self.image_display.setText("Loading image...")
         self.image_display.setPixmap(QPixmap())  # Clear any existing image
         
-        # Start loading image
-        self.image_worker = ImagePreviewWorker(image_url)
-        self.image_worker.image_loaded.connect(self._on_image_loaded)
-        self.image_worker.error_occurred.connect(self._on_image_error)
-        self.image_worker.start()
+        # Hand the request to the preview thread; any older download drops out
+        self._pending_cache_key = cache_key
+        self._preview_worker.latest_key = cache_key
+        self.preview_requested.emit(image_url, cache_key)
     
     def _hide_image_preview(self):
         """Hide the image preview section"""
-        # Cancel any existing image loading
-        if self.image_worker and self.image_worker.isRunning():
-            self.image_worker.quit()
-            self.image_worker.wait()
+        # Drop any preview that is still waiting on the debounce timer
+        self._preview_debounce.stop()
+        self._pending_preview_info = None
+        
+        # Let any running download stop at its next chunk instead of waiting for it
+        self._pending_cache_key = None
+        self._preview_worker.cancel()
         
         self.image_preview_label.setVisible(False)
         self.image_scroll_area.setVisible(False)
         self.image_display.clear()
     
-    def _on_image_loaded(self, pixmap: QPixmap):
+    def shutdown(self):
+        """Stop the preview thread; safe to call more than once"""
+        self._preview_debounce.stop()
+        self._preview_worker.cancel()
+        if self._preview_thread.isRunning():
+            self._preview_thread.quit()
+            self._preview_thread.wait()
+    
+    def closeEvent(self, event):
+        """Stop the preview thread before the widget goes away"""
+        self.shutdown()
+        super().closeEvent(event)
+    
+    def _on_image_loaded(self, cache_key: str, image: QImage):
         """Handle successful image loading"""
+        pixmap = QPixmap.fromImage(image)
+        QPixmapCache.insert(cache_key, pixmap)
+        if cache_key != self._pending_cache_key:
+            return  # Selection moved on while this image was loading
         self.image_display.setPixmap(pixmap)
         self.image_display.setText("")  # Clear loading text
     
-    def _on_image_error(self, error_message: str):
+    def _on_image_error(self, cache_key: str, error_message: str):
         """Handle image loading error"""
+        if cache_key != self._pending_cache_key:
+            return
         self.image_display.setText(f"Failed to load image:\n{error_message}")
         self.image_display.setPixmap(QPixmap())  # Clear any existing image
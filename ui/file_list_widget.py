@@ -5,42 +5,195 @@ Handles file listing, navigation, and virtual folder display
 """
 
 from typing import List, Dict, Any, Optional
-import re
+import os
+import stat
+import threading
+import time
+from bisect import bisect_left
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, 
     QListWidget, QListWidgetItem, QCheckBox, QFileDialog,
     QMessageBox, QInputDialog, QApplication, QLineEdit, QSpinBox,
-    QTableWidget, QTableWidgetItem, QHeaderView, QAbstractItemView
+    QTableView, QHeaderView, QAbstractItemView, QProgressDialog, QStyle
+)
+from PyQt6.QtCore import (
+    Qt, pyqtSignal, QTimer, QUrl, QObject, QRunnable, QThreadPool,
+    QAbstractTableModel, QModelIndex
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QTimer, QUrl
 from PyQt6.QtGui import QFont, QDragEnterEvent, QDropEvent, QDragMoveEvent, QDragLeaveEvent, QPainter, QPen
 
 from backend import FileProcessor
 
 
-class DragDropTableWidget(QTableWidget):
-    """Custom QTableWidget with drag and drop support for file uploads"""
+class _LimitExceeded(Exception):
+    """Raised internally to stop walking dropped files once a limit is hit"""
+
+
+class _ValidationSignals(QObject):
+    """Signals emitted by _ValidationRunnable"""
+    
+    validation_done = pyqtSignal(dict)  # validation_result
+
+
+class _ValidationRunnable(QRunnable):
+    """Runs drop validation on the global thread pool"""
+    
+    def __init__(self, validate, file_paths: List[str]):
+        super().__init__()
+        self.validate = validate
+        self.file_paths = file_paths
+        self.signals = _ValidationSignals()
+    
+    def run(self):
+        self.signals.validation_done.emit(self.validate(self.file_paths))
+
+
+class _ExpandSignals(QObject):
+    """Signals emitted by _ExpandRunnable"""
+    
+    expansion_done = pyqtSignal(list, str)  # expanded_files, target_prefix
+
+
+class _ExpandRunnable(QRunnable):
+    """Expands dropped paths to files on the global thread pool"""
+    
+    def __init__(self, expand, file_paths: List[str], target_prefix: str):
+        super().__init__()
+        self.expand = expand
+        self.file_paths = file_paths
+        self.target_prefix = target_prefix
+        self.signals = _ExpandSignals()
+    
+    def run(self):
+        self.signals.expansion_done.emit(self.expand(self.file_paths), self.target_prefix)
+
+
+class FileTableModel(QAbstractTableModel):
+    """Table model holding one tuple per row instead of a widget item per cell"""
+    
+    HEADERS = ("Name", "Size", "Date")
+    
+    # Row tuple layout: name text, size text, date text, item data, size value.
+    # File rows leave size text as None; it is formatted when a view asks for it,
+    # so populating a page only pays for the rows actually painted
+    _USER_DATA = 3
+    _SIZE_VALUE = 4
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows: List[tuple] = []
+        
+        # One shared icon per row type instead of an emoji baked into every label
+        style = QApplication.style()
+        self._folder_icon = style.standardIcon(QStyle.StandardPixmap.SP_DirIcon)
+        self._file_icon = style.standardIcon(QStyle.StandardPixmap.SP_FileIcon)
+    
+    def set_rows(self, rows: List[tuple]):
+        """Replace all rows in a single model reset"""
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
+    
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+    
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row = self._rows[index.row()]
+        column = index.column()
+        if role == Qt.ItemDataRole.DisplayRole:
+            text = row[column]
+            if text is None:
+                return FileProcessor.format_size(row[self._SIZE_VALUE])
+            return text
+        if role == Qt.ItemDataRole.DecorationRole and column == 0:
+            return self._folder_icon if self._is_folder(row) else self._file_icon
+        if role == Qt.ItemDataRole.UserRole:
+            if column == 0:
+                return row[self._USER_DATA]
+            if column == 1:
+                return row[self._SIZE_VALUE]
+        return None
+    
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return None
+    
+    def _is_folder(self, row: tuple) -> bool:
+        return row[self._USER_DATA].get('is_folder', False)
+    
+    def sort(self, column: int, order: Qt.SortOrder = Qt.SortOrder.AscendingOrder):
+        """Sort rows in place, keeping selection and current index on the same entries"""
+        if not self._rows:
+            return
+        if column == 0:
+            # Folders stay grouped ahead of files, as the old emoji prefixes sorted them
+            is_folder = self._is_folder
+            sort_key = lambda row: (not is_folder(row), row[0])
+        else:
+            sort_key = itemgetter(self._SIZE_VALUE if column == 1 else column)
+        
+        self.layoutAboutToBeChanged.emit()
+        old_indexes = self.persistentIndexList()
+        order_map = sorted(range(len(self._rows)), key=lambda i: sort_key(self._rows[i]),
+                           reverse=order == Qt.SortOrder.DescendingOrder)
+        self._rows = [self._rows[i] for i in order_map]
+        new_row_for = {old_row: new_row for new_row, old_row in enumerate(order_map)}
+        self.changePersistentIndexList(
+            old_indexes,
+            [self.index(new_row_for[index.row()], index.column()) for index in old_indexes]
+        )
+        self.layoutChanged.emit()
+
+
+class DragDropTableView(QTableView):
+    """Custom QTableView with drag and drop support for file uploads"""
     
     # Signal for drag and drop upload
     files_dropped = pyqtSignal(list, str)  # file_paths, target_prefix
     
+    # Directories never descended into when walking dropped folders (along with any
+    # hidden directory); set skip_hidden_dirs to False to walk everything
+    _SKIP_DIRS = frozenset({
+        'node_modules', '__pycache__', '.git', '.venv',
+        '$RECYCLE.BIN', 'System Volume Information', '.Trashes', '.Spotlight-V100', '.fseventsd'
+    })
+    skip_hidden_dirs = True
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.parent_widget = parent
         self.setAcceptDrops(True)
         self.drag_active = False
         
-        # Drag overlay
-        self.drag_overlay = None
+        # Drag overlay, built up front so the first drag doesn't pay for its stylesheet
+        self.drag_overlay = DragOverlay(self)
+        if self.skip_hidden_dirs:
+            self.drag_overlay.label.setToolTip("Hidden folders and node_modules/__pycache__ are skipped")
+            self.drag_overlay.label.setText(
+                "📁 Drop files and folders here to upload\n(hidden folders and node_modules are skipped)"
+            )
+        self.drag_overlay.hide()
+        
+        # Drop currently being validated in the background
+        self._pending_drop: Optional[tuple] = None  # (file_paths, target_prefix)
+        self._validation_runnable: Optional[_ValidationRunnable] = None
+        self._validation_dialog: Optional[QProgressDialog] = None
         
         # Table configuration
         self.setup_table()
     
     def setup_table(self):
         """Setup table columns and properties"""
-        # Set column count and headers
-        self.setColumnCount(3)
-        self.setHorizontalHeaderLabels(["Name", "Size", "Date"])
+        # Headers come from the model
+        self.setModel(FileTableModel(self))
         
         # Configure table properties
         self.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
@@ -54,8 +207,14 @@ class DragDropTableWidget(QTableWidget):
         header.setSectionResizeMode(1, QHeaderView.ResizeMode.ResizeToContents)  # Size column fits content
         header.setSectionResizeMode(2, QHeaderView.ResizeMode.ResizeToContents)  # Date column fits content
         
-        # Hide vertical header (row numbers)
+        # Only size the fit-to-content columns from the rows in view, so a model
+        # reset doesn't ask the model for every row's text
+        header.setResizeContentsPrecision(0)
+        
+        # Hide vertical header (row numbers); rows share one fixed height so the
+        # view never queries per-row size hints
         self.verticalHeader().setVisible(False)
+        self.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
     
     def dragEnterEvent(self, event: QDragEnterEvent):
         """Handle drag enter events"""
@@ -111,73 +270,149 @@ class DragDropTableWidget(QTableWidget):
                 if self.parent_widget and hasattr(self.parent_widget, 'current_folder'):
                     target_prefix = self.parent_widget.current_folder or ""
                 
-                # Validate and emit signal
-                validation_result = self.validate_dropped_files(file_paths)
-                if validation_result['valid']:
-                    self.files_dropped.emit(file_paths, target_prefix)
-                else:
-                    # Show warning dialog
-                    self.show_validation_warning(validation_result)
+                # Validate in the background and emit signal when done
+                self.start_validation(file_paths, target_prefix)
             
             event.setDropAction(Qt.DropAction.CopyAction)
             event.accept()
         else:
             event.ignore()
     
+    def start_validation(self, file_paths: List[str], target_prefix: str):
+        """Validate dropped files on the thread pool so large folders don't block the UI"""
+        if self._pending_drop is not None:
+            return  # A previous drop is still being checked
+        
+        self._pending_drop = (file_paths, target_prefix)
+        
+        self._validation_dialog = QProgressDialog("Checking dropped files...", None, 0, 0, self)
+        self._validation_dialog.setWindowTitle("Preparing Upload")
+        self._validation_dialog.setWindowModality(Qt.WindowModality.WindowModal)
+        self._validation_dialog.setMinimumDuration(300)  # Only show for slow validations
+        
+        self._validation_runnable = _ValidationRunnable(self.validate_dropped_files, file_paths)
+        self._validation_runnable.signals.validation_done.connect(self.on_validation_done)
+        QThreadPool.globalInstance().start(self._validation_runnable)
+    
+    def on_validation_done(self, validation_result: Dict[str, Any]):
+        """Handle background validation result"""
+        if self._validation_dialog:
+            self._validation_dialog.close()
+            self._validation_dialog.deleteLater()
+            self._validation_dialog = None
+        self._validation_runnable = None
+        
+        if self._pending_drop is None:
+            return
+        file_paths, target_prefix = self._pending_drop
+        self._pending_drop = None
+        
+        if validation_result['valid']:
+            self.files_dropped.emit(file_paths, target_prefix)
+        else:
+            # Show warning dialog
+            self.show_validation_warning(validation_result)
+    
+    def should_skip_dir(self, name: str) -> bool:
+        """Check if a directory should be pruned from dropped folder walks"""
+        return self.skip_hidden_dirs and (name.startswith('.') or name in self._SKIP_DIRS)
+    
     def is_valid_file_or_directory(self, path: str) -> bool:
         """Check if the path is a valid file or directory"""
-        import os
         return os.path.exists(path) and (os.path.isfile(path) or os.path.isdir(path))
     
     def validate_dropped_files(self, file_paths: List[str]) -> Dict[str, Any]:
         """Validate dropped files for size and count limits"""
-        import os
-        
         total_files = 0
         total_size = 0
         max_files = 1000  # Maximum number of files
         max_size = 10 * 1024 * 1024 * 1024  # 10 GB limit
         
-        def count_files_recursive(path: str) -> tuple:
-            """Count files and total size recursively"""
+        # Dropped roots are walked in parallel; totals are shared under a lock and
+        # the first walker to exceed a limit tells the others to stop
+        totals_lock = threading.Lock()
+        limit_hit = threading.Event()
+        
+        def add_file(file_size: int):
+            """Add one file to the shared totals, raising once a limit is exceeded"""
             nonlocal total_files, total_size
-            
-            if os.path.isfile(path):
+            with totals_lock:
                 total_files += 1
-                total_size += os.path.getsize(path)
-                return 1, os.path.getsize(path)
-            elif os.path.isdir(path):
-                dir_files = 0
-                dir_size = 0
-                try:
-                    for root, dirs, files in os.walk(path):
-                        for file in files:
-                            file_path = os.path.join(root, file)
-                            try:
-                                file_size = os.path.getsize(file_path)
-                                dir_files += 1
-                                dir_size += file_size
-                                total_files += 1
-                                total_size += file_size
-                                
-                                # Early exit if limits exceeded
-                                if total_files > max_files or total_size > max_size:
-                                    return dir_files, dir_size
-                            except (OSError, IOError):
-                                # Skip files that can't be accessed
-                                continue
-                except (OSError, IOError):
-                    # Skip directories that can't be accessed
-                    pass
-                return dir_files, dir_size
-            return 0, 0
-        
-        # Count all files
-        for file_path in file_paths:
-            count_files_recursive(file_path)
-            # Early exit if limits exceeded
-            if total_files > max_files or total_size > max_size:
-                break
+                total_size += file_size
+                if total_files > max_files or total_size > max_size:
+                    limit_hit.set()
+                    raise _LimitExceeded()
+        
+        def count_files_recursive(path: str):
+            """Count files and total size recursively, raising once a limit is exceeded"""
+            nonlocal total_files
+            
+            # One stat for the dropped root instead of isfile + getsize + isdir
+            try:
+                root_stat = os.stat(path)
+            except OSError:
+                return
+            
+            if stat.S_ISREG(root_stat.st_mode):
+                add_file(root_stat.st_size)
+            elif stat.S_ISDIR(root_stat.st_mode):
+                # Iterative scandir walk: file type comes from the directory listing,
+                # so each file costs a single stat call for its size
+                pending_dirs = [path]
+                while pending_dirs:
+                    try:
+                        with os.scandir(pending_dirs.pop()) as entries:
+                            for entry in entries:
+                                if limit_hit.is_set():
+                                    raise _LimitExceeded()
+                                try:
+                                    if entry.is_dir(follow_symlinks=False):
+                                        if not self.should_skip_dir(entry.name):
+                                            pending_dirs.append(entry.path)
+                                    elif entry.is_file():
+                                        # Symlinked files count at their target's size, since
+                                        # that is what gets uploaded.
+                                        # Check the count before paying for the stat call
+                                        with totals_lock:
+                                            if total_files + 1 > max_files:
+                                                total_files += 1
+                                                limit_hit.set()
+                                                raise _LimitExceeded()
+                                        add_file(entry.stat().st_size)
+                                except (OSError, IOError):
+                                    # Skip files that can't be accessed
+                                    continue
+                    except (OSError, IOError):
+                        # Skip directories that can't be accessed
+                        continue
+        
+        def count_root(path: str):
+            """Walk one dropped path unless another walker already hit a limit"""
+            if limit_hit.is_set():
+                return
+            try:
+                count_files_recursive(path)
+            except _LimitExceeded:
+                pass
+        
+        # Fast path: a drop of plain files needs one stat per path and no walk
+        file_stats = None
+        if len(file_paths) <= max_files:
+            try:
+                # Follow symlinks so a linked file is measured by its target, not the link
+                file_stats = [os.stat(path) for path in file_paths]
+            except OSError:
+                file_stats = None
+        
+        if file_stats is not None and all(stat.S_ISREG(st.st_mode) for st in file_stats):
+            total_files = len(file_stats)
+            total_size = sum(st.st_size for st in file_stats)
+        elif len(file_paths) == 1:
+            count_root(file_paths[0])
+        else:
+            # Count all files, stopping as soon as a limit is exceeded
+            with ThreadPoolExecutor(max_workers=min(8, len(file_paths))) as executor:
+                list(executor.map(count_root, file_paths))
         
         # Check limits
         valid = True
@@ -209,22 +444,18 @@ class DragDropTableWidget(QTableWidget):
     
     def show_drag_overlay(self):
         """Show drag overlay with upload indication"""
-        if not self.drag_overlay:
-            self.drag_overlay = DragOverlay(self)
-        
         self.drag_overlay.resize(self.size())
         self.drag_overlay.show()
         self.drag_overlay.raise_()
     
     def hide_drag_overlay(self):
         """Hide drag overlay"""
-        if self.drag_overlay:
-            self.drag_overlay.hide()
+        self.drag_overlay.hide()
     
     def resizeEvent(self, event):
         """Handle resize events to update overlay"""
         super().resizeEvent(event)
-        if self.drag_overlay and self.drag_overlay.isVisible():
+        if self.drag_overlay.isVisible():
             self.drag_overlay.resize(self.size())
 
 
@@ -263,7 +494,7 @@ class FileListWidget(QWidget):
     """Widget for displaying and managing S3 file lists"""
     
     # Signals
-    item_double_clicked = pyqtSignal(QTableWidgetItem)
+    item_double_clicked = pyqtSignal(QModelIndex)
     selection_changed = pyqtSignal()
     upload_requested = pyqtSignal(list, str)  # files_to_upload, s3_prefix
     download_requested = pyqtSignal(list)  # selected_items
@@ -276,14 +507,26 @@ class FileListWidget(QWidget):
         self.filtered_files: List[Dict[str, Any]] = []
         self.current_folder: Optional[str] = None
         self.search_query: str = ""
+        self._search_query_cf: str = ""  # Casefolded search_query used for matching
+        self._folders_cache = (None, None)  # (key, organize_files_by_folders result)
+        self._last_query: str = ""  # Casefolded query behind _last_filtered
+        self._last_filtered: Optional[List[Dict[str, Any]]] = None
+        # Files sorted by key (and their keys) for bisecting folder prefixes; built lazily
+        self._sorted_files: Optional[List[Dict[str, Any]]] = None
+        self._sorted_keys: Optional[List[str]] = None
         self.search_timer = QTimer()
         self.search_timer.setSingleShot(True)
         self.search_timer.timeout.connect(self.perform_search)
+        self._last_search_ms: float = 0.0  # Duration of the last perform_search
         
         # Pagination settings
         self.page_size = 1000  # Max items per page
         self.current_page = 0
         self.total_pages = 0
+        self._pagination_state = None  # (current_page, total_pages) last shown in the controls
+        
+        # Dropped paths currently being expanded in the background
+        self._expand_runnable: Optional[_ExpandRunnable] = None
         
         self.init_ui()
     
@@ -300,14 +543,15 @@ class FileListWidget(QWidget):
         layout.addLayout(title_layout)
         
         # Pagination controls
-        pagination_layout = self._create_pagination_controls()
-        layout.addLayout(pagination_layout)
+        self.pagination_container = self._create_pagination_controls()
+        layout.addWidget(self.pagination_container)
         
         # File table with drag and drop support
-        self.file_table = DragDropTableWidget(self)
-        self.file_table.currentItemChanged.connect(self.on_file_selected)
-        self.file_table.itemSelectionChanged.connect(self.selection_changed.emit)
-        self.file_table.itemDoubleClicked.connect(self.item_double_clicked.emit)
+        self.file_table = DragDropTableView(self)
+        self.file_model = self.file_table.model()
+        self.file_table.selectionModel().currentRowChanged.connect(self.on_file_selected)
+        self.file_table.selectionModel().selectionChanged.connect(self.selection_changed.emit)
+        self.file_table.doubleClicked.connect(self.on_index_double_clicked)
         self.file_table.files_dropped.connect(self.on_files_dropped)
         layout.addWidget(self.file_table)
     
@@ -373,9 +617,11 @@ class FileListWidget(QWidget):
         
         return search_layout
     
-    def _create_pagination_controls(self) -> QHBoxLayout:
-        """Create the pagination controls layout"""
-        pagination_layout = QHBoxLayout()
+    def _create_pagination_controls(self) -> QWidget:
+        """Create the pagination controls in one container that is shown/hidden as a unit"""
+        pagination_container = QWidget()
+        pagination_layout = QHBoxLayout(pagination_container)
+        pagination_layout.setContentsMargins(0, 0, 0, 0)
         
         self.pagination_info_label = QLabel("Page 0 of 0")
         self.pagination_info_label.setStyleSheet("color: gray;")
@@ -421,18 +667,21 @@ class FileListWidget(QWidget):
         pagination_layout.addWidget(self.last_page_button)
         
         # Initially hide pagination controls
-        self.pagination_info_label.setVisible(False)
-        self.first_page_button.setVisible(False)
-        self.prev_page_button.setVisible(False)
-        self.page_spinbox.setVisible(False)
-        self.next_page_button.setVisible(False)
-        self.last_page_button.setVisible(False)
+        pagination_container.setVisible(False)
         
-        return pagination_layout
+        return pagination_container
     
     def set_files(self, files: List[Dict[str, Any]]):
         """Set the current files list"""
+        # Casefold each key once here rather than on every search
+        for file_info in files:
+            if '_key_cf' not in file_info:
+                file_info['_key_cf'] = file_info['key'].casefold()
         self.current_files = files
+        self._folders_cache = (None, None)
+        self._last_filtered = None
+        self._sorted_files = None
+        self._sorted_keys = None
         self.current_page = 0  # Reset to first page when new files are loaded
         self.refresh_display()
     
@@ -444,29 +693,39 @@ class FileListWidget(QWidget):
             # Use search and pagination for root view
             self.filter_and_paginate_files()
     
-    def populate_file_list(self, files: List[Dict[str, Any]]):
-        """Populate the file table widget with flat file view"""
-        self.file_table.setRowCount(len(files))
+    def _file_row(self, file_info: Dict[str, Any], display_name: Optional[str] = None) -> tuple:
+        """Build a table row for a file"""
+        return (
+            display_name or file_info['key'],
+            None,  # Size text is formatted lazily by FileTableModel
+            file_info.get('last_modified', 'Unknown'),
+            file_info,
+            file_info['size']
+        )
+    
+    def _folder_row(self, folder_info: Dict[str, Any]) -> tuple:
+        """Build a table row for a virtual folder"""
+        size_str = FileProcessor.format_size(folder_info['total_size'])
+        return (
+            f"{folder_info['folder_name']}/",
+            f"{folder_info['file_count']} files, {size_str}",
+            "—",  # Folders don't have dates
+            folder_info,
+            folder_info['total_size']
+        )
+    
+    def _set_rows(self, rows: List[tuple]):
+        """Replace the table contents in one model reset"""
         self.file_table.setSortingEnabled(False)  # Disable sorting during population
+        self.file_model.set_rows(rows)
+        self.file_table.setSortingEnabled(True)  # Re-enable sorting (re-sorts by current column)
         
-        for row, file_info in enumerate(files):
-            # Name column
-            name_item = QTableWidgetItem(f"📄 {file_info['key']}")
-            name_item.setData(Qt.ItemDataRole.UserRole, file_info)
-            self.file_table.setItem(row, 0, name_item)
-            
-            # Size column
-            size_str = FileProcessor.format_size(file_info['size'])
-            size_item = QTableWidgetItem(size_str)
-            size_item.setData(Qt.ItemDataRole.UserRole, file_info['size'])  # Store numeric value for sorting
-            self.file_table.setItem(row, 1, size_item)
-            
-            # Date column
-            date_str = file_info.get('last_modified', 'Unknown')
-            date_item = QTableWidgetItem(date_str)
-            self.file_table.setItem(row, 2, date_item)
-            
-        self.file_table.setSortingEnabled(True)  # Re-enable sorting
+        # A model reset drops the selection without emitting selectionChanged
+        self.selection_changed.emit()
+    
+    def populate_file_list(self, files: List[Dict[str, Any]]):
+        """Populate the file table widget with flat file view"""
+        self._set_rows([self._file_row(file_info) for file_info in files])
         self.file_count_label.setText(f"{len(files)} files")
     
     def populate_file_list_with_folders(self):
@@ -474,65 +733,26 @@ class FileListWidget(QWidget):
         if not self.current_files:
             return
             
-        folders, root_files = FileProcessor.organize_files_by_folders(self.current_files)
-        
-        total_items = len(folders) + len(root_files)
-        self.file_table.setRowCount(total_items)
-        self.file_table.setSortingEnabled(False)  # Disable sorting during population
-        
-        row = 0
+        folder_names, folder_files, folder_sizes, root_files = \
+            FileProcessor.organize_files_by_folders(self.current_files)
         
-        # Add folders
-        for folder_name in sorted(folders.keys()):
-            folder_files = folders[folder_name]
-            total_size = sum(f['size'] for f in folder_files)
-            size_str = FileProcessor.format_size(total_size)
-            
-            # Name column
-            name_item = QTableWidgetItem(f"📁 {folder_name}/")
-            folder_info = {
+        # Add folders (already sorted, sizes summed while grouping)
+        rows = [
+            self._folder_row({
                 'is_folder': True,
                 'folder_name': folder_name,
-                'files': folder_files,
-                'file_count': len(folder_files),
+                'files': files,
+                'file_count': len(files),
                 'total_size': total_size
-            }
-            name_item.setData(Qt.ItemDataRole.UserRole, folder_info)
-            self.file_table.setItem(row, 0, name_item)
-            
-            # Size column
-            size_item = QTableWidgetItem(f"{len(folder_files)} files, {size_str}")
-            size_item.setData(Qt.ItemDataRole.UserRole, total_size)  # Store numeric value for sorting
-            self.file_table.setItem(row, 1, size_item)
-            
-            # Date column
-            date_item = QTableWidgetItem("—")  # Folders don't have dates
-            self.file_table.setItem(row, 2, date_item)
-            
-            row += 1
+            })
+            for folder_name, files, total_size in zip(folder_names, folder_files, folder_sizes)
+        ]
         
         # Add root files
-        for file_info in root_files:
-            # Name column
-            name_item = QTableWidgetItem(f"📄 {file_info['key']}")
-            name_item.setData(Qt.ItemDataRole.UserRole, file_info)
-            self.file_table.setItem(row, 0, name_item)
-            
-            # Size column
-            size_str = FileProcessor.format_size(file_info['size'])
-            size_item = QTableWidgetItem(size_str)
-            size_item.setData(Qt.ItemDataRole.UserRole, file_info['size'])
-            self.file_table.setItem(row, 1, size_item)
-            
-            # Date column
-            date_str = file_info.get('last_modified', 'Unknown')
-            date_item = QTableWidgetItem(date_str)
-            self.file_table.setItem(row, 2, date_item)
-            
-            row += 1
+        rows.extend(self._file_row(file_info) for file_info in root_files)
         
-        self.file_table.setSortingEnabled(True)  # Re-enable sorting
-        folder_count = len(folders)
+        self._set_rows(rows)
+        folder_count = len(folder_names)
         file_count = len(root_files)
         self.file_count_label.setText(f"{folder_count} folders, {file_count} files")
     
@@ -541,71 +761,48 @@ class FileListWidget(QWidget):
         if not self.current_files:
             return
         
-        subdirectories, direct_files = FileProcessor.get_folder_contents(self.current_files, folder_path)
+        subdirectory_names, subdirectory_files, subdirectory_sizes, direct_files = \
+            FileProcessor.get_folder_contents(self._files_with_prefix(f"{folder_path}/"), folder_path)
         
-        total_items = len(subdirectories) + len(direct_files)
-        self.file_table.setRowCount(total_items)
-        self.file_table.setSortingEnabled(False)  # Disable sorting during population
-        
-        row = 0
-        
-        # Add subdirectories first (sorted)
-        for subdirectory_name in sorted(subdirectories.keys()):
-            subdir_files = subdirectories[subdirectory_name]
-            total_size = sum(f['size'] for f in subdir_files)
-            size_str = FileProcessor.format_size(total_size)
-            
-            # Name column
-            name_item = QTableWidgetItem(f"📁 {subdirectory_name}/")
-            folder_info = {
+        # Add subdirectories first (already sorted, sizes summed while grouping)
+        rows = [
+            self._folder_row({
                 'is_folder': True,
                 'folder_name': subdirectory_name,
                 'folder_path': f"{folder_path}/{subdirectory_name}",  # Full path for navigation
                 'files': subdir_files,
                 'file_count': len(subdir_files),
                 'total_size': total_size
-            }
-            name_item.setData(Qt.ItemDataRole.UserRole, folder_info)
-            self.file_table.setItem(row, 0, name_item)
-            
-            # Size column
-            size_item = QTableWidgetItem(f"{len(subdir_files)} files, {size_str}")
-            size_item.setData(Qt.ItemDataRole.UserRole, total_size)
-            self.file_table.setItem(row, 1, size_item)
-            
-            # Date column
-            date_item = QTableWidgetItem("—")
-            self.file_table.setItem(row, 2, date_item)
-            
-            row += 1
+            })
+            for subdirectory_name, subdir_files, total_size
+            in zip(subdirectory_names, subdirectory_files, subdirectory_sizes)
+        ]
         
         # Add direct files (sorted)
         for file_info, display_name in sorted(direct_files, key=lambda x: x[1]):
-            # Name column
-            name_item = QTableWidgetItem(f"📄 {display_name}")
-            name_item.setData(Qt.ItemDataRole.UserRole, file_info)
-            self.file_table.setItem(row, 0, name_item)
-            
-            # Size column
-            size_str = FileProcessor.format_size(file_info['size'])
-            size_item = QTableWidgetItem(size_str)
-            size_item.setData(Qt.ItemDataRole.UserRole, file_info['size'])
-            self.file_table.setItem(row, 1, size_item)
-            
-            # Date column
-            date_str = file_info.get('last_modified', 'Unknown')
-            date_item = QTableWidgetItem(date_str)
-            self.file_table.setItem(row, 2, date_item)
-            
-            row += 1
+            rows.append(self._file_row(file_info, display_name))
         
-        self.file_table.setSortingEnabled(True)  # Re-enable sorting
+        self._set_rows(rows)
         
-        if len(subdirectories) > 0:
-            self.file_count_label.setText(f"{len(subdirectories)} folders, {len(direct_files)} files in {folder_path}/")
+        if len(subdirectory_names) > 0:
+            self.file_count_label.setText(f"{len(subdirectory_names)} folders, {len(direct_files)} files in {folder_path}/")
         else:
             self.file_count_label.setText(f"{len(direct_files)} files in {folder_path}/")
     
+    def _files_with_prefix(self, prefix: str) -> List[Dict[str, Any]]:
+        """Get files whose key starts with prefix by bisecting a sorted key index"""
+        if self._sorted_keys is None:
+            self._sorted_files = sorted(self.current_files, key=itemgetter('key'))
+            self._sorted_keys = [file_info['key'] for file_info in self._sorted_files]
+        
+        if not prefix:
+            return self._sorted_files
+        # Every key with this prefix sorts between prefix and prefix with its last char bumped
+        upper = prefix[:-1] + chr(ord(prefix[-1]) + 1)
+        start = bisect_left(self._sorted_keys, prefix)
+        end = bisect_left(self._sorted_keys, upper, start)
+        return self._sorted_files[start:end]
+    
     def navigate_to_folder(self, folder_path: str):
         """Navigate into a virtual folder"""
         self.current_folder = folder_path
@@ -635,33 +832,35 @@ class FileListWidget(QWidget):
         self.current_page = 0  # Reset to first page when toggling view
         self.refresh_display()
     
-    def get_selected_items(self) -> List[QTableWidgetItem]:
-        """Get currently selected items"""
-        selected_items = []
-        selected_ranges = self.file_table.selectedRanges()
-        for range_ in selected_ranges:
-            for row in range(range_.topRow(), range_.bottomRow() + 1):
-                item = self.file_table.item(row, 0)  # Always get the first column (name column)
-                if item and item not in selected_items:
-                    selected_items.append(item)
-        return selected_items
-    
-    def get_current_item(self) -> Optional[QTableWidgetItem]:
+    def get_selected_items(self) -> List[QModelIndex]:
+        """Get currently selected items (name column index per row)"""
+        return sorted(self.file_table.selectionModel().selectedRows(0), key=lambda index: index.row())
+    
+    def get_current_item(self) -> Optional[QModelIndex]:
         """Get currently selected item"""
-        return self.file_table.currentItem()
+        current = self.file_table.currentIndex()
+        if not current.isValid():
+            return None
+        return current.siblingAtColumn(0)  # Item data lives in the name column
+    
+    def on_index_double_clicked(self, index: QModelIndex):
+        """Forward double clicks with the name column index"""
+        self.item_double_clicked.emit(index.siblingAtColumn(0))
     
     def clear(self):
         """Clear the file table"""
-        self.file_table.setRowCount(0)
+        self._set_rows([])
         self.file_count_label.setText("0 files")
         self.current_folder = None
         self.current_page = 0
         self.search_query = ""
+        self._search_query_cf = ""
+        self._folders_cache = (None, None)
         self.search_edit.clear()
         self.hide_pagination_controls()
         self.update_navigation_controls()
     
-    def on_file_selected(self, current_item: Optional[QTableWidgetItem], previous_item: Optional[QTableWidgetItem]):
+    def on_file_selected(self, current: QModelIndex, previous: QModelIndex):
         """Handle file selection - this can be overridden by parent"""
         pass
     
@@ -677,7 +876,6 @@ class FileListWidget(QWidget):
         
         # Remember last directory
         if files_to_upload:
-            import os
             last_dir = os.path.dirname(files_to_upload[0])
             QApplication.instance().setProperty("last_directory", last_dir)
         
@@ -728,45 +926,54 @@ class FileListWidget(QWidget):
     def on_search_text_changed(self, text: str):
         """Handle search text changes with debouncing"""
         self.search_query = text.strip()
+        self._search_query_cf = self.search_query.casefold()
         self.search_timer.stop()
-        self.search_timer.start(300)  # 300ms delay
+        self.search_timer.start(self._search_delay())
+    
+    def _search_delay(self) -> int:
+        """Debounce delay in ms, scaled to the file count and the last search cost"""
+        file_count = len(self.current_files)
+        delay = 50 if file_count < 10_000 else 150 if file_count < 100_000 else 300
+        # Never fire faster than the previous search took to run
+        return max(delay, min(1000, int(self._last_search_ms)))
     
     def perform_search(self):
         """Perform the actual search and update display"""
+        started = time.perf_counter()
+        self._folders_cache = (None, None)
         self.current_page = 0
         self.filter_and_paginate_files()
+        self._last_search_ms = (time.perf_counter() - started) * 1000
     
     def clear_search(self):
         """Clear the search query and show all files"""
         self.search_edit.clear()
         self.search_query = ""
+        self._search_query_cf = ""
         self.current_page = 0
         self.filter_and_paginate_files()
     
     def filter_files(self, files: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Filter files based on search query"""
-        if not self.search_query:
+        """Filter files based on search query (case-insensitive substring match)"""
+        query = self._search_query_cf
+        if not query:
+            self._last_query = ""
+            self._last_filtered = None
             return files
         
-        filtered = []
-        # Create case-insensitive regex pattern
-        try:
-            pattern = re.compile(re.escape(self.search_query), re.IGNORECASE)
-        except re.error:
-            # If regex fails, fall back to simple string matching
-            pattern = None
-        
-        for file_info in files:
-            filename = file_info['key']
-            
-            # Search in filename
-            if pattern:
-                if pattern.search(filename):
-                    filtered.append(file_info)
-            else:
-                if self.search_query.lower() in filename.lower():
-                    filtered.append(file_info)
-        
+        # A query that extends the previous one can only match a subset of the
+        # previous result, so narrow that instead of rescanning every file
+        source = files
+        if (self._last_filtered is not None and files is self.current_files
+                and query.startswith(self._last_query)):
+            source = self._last_filtered
+        
+        filtered = [
+            file_info for file_info in source
+            if query in (file_info.get('_key_cf') or file_info['key'].casefold())
+        ]
+        self._last_query = query
+        self._last_filtered = filtered
         return filtered
     
     def filter_and_paginate_files(self):
@@ -781,6 +988,10 @@ class FileListWidget(QWidget):
             self.filtered_files = self.filter_files(self.current_files)
             self.populate_file_list_with_folders_filtered()
             return
+        elif not self._search_query_cf:
+            # Flat file view without a search: page straight over current_files
+            self.filtered_files = self.current_files
+            self._last_filtered = None
         else:
             # Flat file view
             self.filtered_files = self.filter_files(self.current_files)
@@ -795,15 +1006,14 @@ class FileListWidget(QWidget):
         # Get current page items
         start_idx = self.current_page * self.page_size
         end_idx = min(start_idx + self.page_size, total_items)
-        page_files = self.filtered_files[start_idx:end_idx]
         
-        # Populate the list
-        self.populate_file_list_paginated(page_files, start_idx, total_items)
+        # Populate the list straight from the master list, no page slice
+        self.populate_file_list_paginated(self.filtered_files, start_idx, end_idx)
     
     def populate_file_list_with_folders_filtered(self):
         """Populate file table with virtual folder structure (filtered)"""
         if not self.filtered_files:
-            self.file_table.setRowCount(0)
+            self._set_rows([])
             if self.search_query:
                 self.file_count_label.setText(f"0 files match '{self.search_query}'")
             else:
@@ -811,131 +1021,70 @@ class FileListWidget(QWidget):
             self.hide_pagination_controls()
             return
         
-        folders, root_files = FileProcessor.organize_files_by_folders(self.filtered_files)
+        # filtered_files is rebuilt on every page flip, so key the grouping on the
+        # source list and query it was derived from rather than on its own identity
+        cache_key = (id(self.current_files), len(self.filtered_files), self.search_query)
+        if self._folders_cache[0] == cache_key:
+            organized = self._folders_cache[1]
+        else:
+            organized = FileProcessor.organize_files_by_folders(self.filtered_files)
+            self._folders_cache = (cache_key, organized)
+        folder_names, folder_files, folder_sizes, root_files = organized
+        folder_count = len(folder_names)
         
-        # Calculate total items for pagination
-        total_items = len(folders) + len(root_files)
+        # Calculate total items for pagination (folders first, then root files)
+        total_items = folder_count + len(root_files)
         self.total_pages = max(1, (total_items + self.page_size - 1) // self.page_size)
         
         # Update pagination controls
         self.update_pagination_controls(total_items)
         
-        # Get items for current page
-        all_items = []
-        
-        # Add folders first
-        for folder_name in sorted(folders.keys()):
-            folder_files = folders[folder_name]
-            total_size = sum(f['size'] for f in folder_files)
-            all_items.append({
-                'type': 'folder',
-                'name': folder_name,
-                'files': folder_files,
-                'file_count': len(folder_files),
-                'total_size': total_size
-            })
-        
-        # Add root files
-        for file_info in root_files:
-            all_items.append({
-                'type': 'file',
-                'file_info': file_info
-            })
-        
-        # Paginate
+        # Paginate by index over the parallel folder lists and the root files
         start_idx = self.current_page * self.page_size
-        end_idx = min(start_idx + self.page_size, len(all_items))
-        page_items = all_items[start_idx:end_idx]
+        end_idx = min(start_idx + self.page_size, total_items)
         
         # Populate the table
-        self.file_table.setRowCount(len(page_items))
-        self.file_table.setSortingEnabled(False)  # Disable sorting during population
-        
-        for row, item in enumerate(page_items):
-            if item['type'] == 'folder':
-                # Name column
-                name_item = QTableWidgetItem(f"📁 {item['name']}/")
-                folder_info = {
-                    'is_folder': True,
-                    'folder_name': item['name'],
-                    'files': item['files'],
-                    'file_count': item['file_count'],
-                    'total_size': item['total_size']
-                }
-                name_item.setData(Qt.ItemDataRole.UserRole, folder_info)
-                self.file_table.setItem(row, 0, name_item)
-                
-                # Size column
-                size_str = FileProcessor.format_size(item['total_size'])
-                size_item = QTableWidgetItem(f"{item['file_count']} files, {size_str}")
-                size_item.setData(Qt.ItemDataRole.UserRole, item['total_size'])
-                self.file_table.setItem(row, 1, size_item)
-                
-                # Date column
-                date_item = QTableWidgetItem("—")
-                self.file_table.setItem(row, 2, date_item)
-            else:
-                file_info = item['file_info']
-                
-                # Name column
-                name_item = QTableWidgetItem(f"📄 {file_info['key']}")
-                name_item.setData(Qt.ItemDataRole.UserRole, file_info)
-                self.file_table.setItem(row, 0, name_item)
-                
-                # Size column
-                size_str = FileProcessor.format_size(file_info['size'])
-                size_item = QTableWidgetItem(size_str)
-                size_item.setData(Qt.ItemDataRole.UserRole, file_info['size'])
-                self.file_table.setItem(row, 1, size_item)
-                
-                # Date column
-                date_str = file_info.get('last_modified', 'Unknown')
-                date_item = QTableWidgetItem(date_str)
-                self.file_table.setItem(row, 2, date_item)
+        rows = [
+            self._folder_row({
+                'is_folder': True,
+                'folder_name': folder_names[i],
+                'files': folder_files[i],
+                'file_count': len(folder_files[i]),
+                'total_size': folder_sizes[i]
+            })
+            for i in range(start_idx, min(end_idx, folder_count))
+        ]
+        rows.extend(
+            self._file_row(file_info)
+            for file_info in root_files[max(0, start_idx - folder_count):max(0, end_idx - folder_count)]
+        )
         
-        self.file_table.setSortingEnabled(True)  # Re-enable sorting
+        self._set_rows(rows)
         
         # Update count label
         if self.search_query:
-            self.file_count_label.setText(f"{len(folders)} folders, {len(root_files)} files match '{self.search_query}'")
+            self.file_count_label.setText(f"{folder_count} folders, {len(root_files)} files match '{self.search_query}'")
         else:
-            self.file_count_label.setText(f"{len(folders)} folders, {len(root_files)} files")
+            self.file_count_label.setText(f"{folder_count} folders, {len(root_files)} files")
     
-    def populate_file_list_paginated(self, files: List[Dict[str, Any]], start_idx: int, total_items: int):
-        """Populate the file table widget with paginated file view"""
-        self.file_table.setRowCount(len(files))
-        self.file_table.setSortingEnabled(False)  # Disable sorting during population
-        
-        for row, file_info in enumerate(files):
-            # Name column
-            name_item = QTableWidgetItem(f"📄 {file_info['key']}")
-            name_item.setData(Qt.ItemDataRole.UserRole, file_info)
-            self.file_table.setItem(row, 0, name_item)
-            
-            # Size column
-            size_str = FileProcessor.format_size(file_info['size'])
-            size_item = QTableWidgetItem(size_str)
-            size_item.setData(Qt.ItemDataRole.UserRole, file_info['size'])
-            self.file_table.setItem(row, 1, size_item)
-            
-            # Date column
-            date_str = file_info.get('last_modified', 'Unknown')
-            date_item = QTableWidgetItem(date_str)
-            self.file_table.setItem(row, 2, date_item)
-        
-        self.file_table.setSortingEnabled(True)  # Re-enable sorting
+    def populate_file_list_paginated(self, files: List[Dict[str, Any]], start_idx: int, end_idx: int):
+        """Populate the file table widget with files[start_idx:end_idx] (paginated file view)"""
+        file_row = self._file_row
+        self._set_rows([file_row(files[i]) for i in range(start_idx, end_idx)])
         
         # Update count label
+        total_items = len(files)
+        shown = end_idx - start_idx
         if self.search_query:
-            if total_items == len(files):
+            if total_items == shown:
                 self.file_count_label.setText(f"{total_items} files match '{self.search_query}'")
             else:
-                self.file_count_label.setText(f"Showing {len(files)} of {total_items} files matching '{self.search_query}'")
+                self.file_count_label.setText(f"Showing {shown} of {total_items} files matching '{self.search_query}'")
         else:
-            if total_items == len(files):
+            if total_items == shown:
                 self.file_count_label.setText(f"{total_items} files")
             else:
-                self.file_count_label.setText(f"Showing {len(files)} of {total_items} files")
+                self.file_count_label.setText(f"Showing {shown} of {total_items} files")
     
     # Pagination functionality
     def update_pagination_controls(self, total_items: int):
@@ -945,12 +1094,20 @@ class FileListWidget(QWidget):
         if show_pagination:
             self.show_pagination_controls()
             
+            # Nothing to touch if the page position hasn't changed since last time
+            pagination_state = (self.current_page, self.total_pages)
+            if pagination_state == self._pagination_state:
+                return
+            self._pagination_state = pagination_state
+            
             # Update pagination info
             self.pagination_info_label.setText(f"Page {self.current_page + 1} of {self.total_pages}")
             
-            # Update spinbox
+            # Update spinbox without re-entering go_to_page
+            self.page_spinbox.blockSignals(True)
             self.page_spinbox.setMaximum(self.total_pages)
             self.page_spinbox.setValue(self.current_page + 1)
+            self.page_spinbox.blockSignals(False)
             
             # Update button states
             self.first_page_button.setEnabled(self.current_page > 0)
@@ -962,21 +1119,11 @@ class FileListWidget(QWidget):
     
     def show_pagination_controls(self):
         """Show pagination controls"""
-        self.pagination_info_label.setVisible(True)
-        self.first_page_button.setVisible(True)
-        self.prev_page_button.setVisible(True)
-        self.page_spinbox.setVisible(True)
-        self.next_page_button.setVisible(True)
-        self.last_page_button.setVisible(True)
+        self.pagination_container.setVisible(True)
     
     def hide_pagination_controls(self):
         """Hide pagination controls"""
-        self.pagination_info_label.setVisible(False)
-        self.first_page_button.setVisible(False)
-        self.prev_page_button.setVisible(False)
-        self.page_spinbox.setVisible(False)
-        self.next_page_button.setVisible(False)
-        self.last_page_button.setVisible(False)
+        self.pagination_container.setVisible(False)
     
     def go_to_first_page(self):
         """Go to first page"""
@@ -1009,8 +1156,14 @@ class FileListWidget(QWidget):
     
     def on_files_dropped(self, file_paths: List[str], target_prefix: str):
         """Handle files dropped onto the file list"""
-        # Expand directories to individual files
-        expanded_files = self.expand_paths_to_files(file_paths)
+        # Expand directories to individual files on the thread pool
+        self._expand_runnable = _ExpandRunnable(self.expand_paths_to_files, file_paths, target_prefix)
+        self._expand_runnable.signals.expansion_done.connect(self.on_files_expanded)
+        QThreadPool.globalInstance().start(self._expand_runnable)
+    
+    def on_files_expanded(self, expanded_files: List[str], target_prefix: str):
+        """Handle background expansion result"""
+        self._expand_runnable = None
         
         if expanded_files:
             # Emit upload request with expanded file list
@@ -1018,21 +1171,44 @@ class FileListWidget(QWidget):
     
     def expand_paths_to_files(self, paths: List[str]) -> List[str]:
         """Expand directory paths to individual file paths"""
-        import os
+        if len(paths) > 1:
+            # Walking is syscall-bound, so independent roots are scanned in parallel;
+            # map() keeps results in drop order
+            with ThreadPoolExecutor(max_workers=min(8, len(paths))) as executor:
+                per_path = list(executor.map(self._expand_path, paths))
+        else:
+            per_path = [self._expand_path(path) for path in paths]
         
         expanded_files = []
+        for files in per_path:
+            expanded_files.extend(files)
+        return expanded_files
+    
+    def _expand_path(self, path: str) -> List[str]:
+        """Expand one dropped path to the files under it"""
+        expanded_files = []
         
-        for path in paths:
-            if os.path.isfile(path):
-                expanded_files.append(path)
-            elif os.path.isdir(path):
-                # Walk through directory and add all files
+        if os.path.isfile(path):
+            expanded_files.append(path)
+        elif os.path.isdir(path):
+            # Iterative scandir walk: file type comes from the directory listing,
+            # so no extra stat per file
+            pending_dirs = [path]
+            while pending_dirs:
                 try:
-                    for root, dirs, files in os.walk(path):
-                        for file in files:
-                            file_path = os.path.join(root, file)
-                            if os.path.isfile(file_path):
-                                expanded_files.append(file_path)
+                    with os.scandir(pending_dirs.pop()) as entries:
+                        for entry in entries:
+                            try:
+                                if entry.is_dir(follow_symlinks=False):
+                                    # Prune the same directories the drop validation skipped
+                                    if not self.file_table.should_skip_dir(entry.name):
+                                        pending_dirs.append(entry.path)
+                                elif entry.is_file():
+                                    # Symlinked files are uploaded like the baseline os.walk did;
+                                    # symlinked directories above are still not followed
+                                    expanded_files.append(entry.path)
+                            except OSError:
+                                continue
                 except (OSError, IOError):
                     # Skip directories that can't be accessed
                     continue